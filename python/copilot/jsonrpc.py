@@ -8,11 +8,14 @@ Much simpler and more reliable than pure asyncio subprocess.
 import asyncio
 import inspect
 import json
+import logging
 import threading
 import uuid
 from collections.abc import Awaitable
 from typing import Any, Callable, Optional, Union
 
+logger = logging.getLogger(__name__)
+
 
 class JsonRpcError(Exception):
     """JSON-RPC error response"""
@@ -27,6 +30,12 @@ class JsonRpcError(Exception):
 RequestHandler = Callable[[dict], Union[dict, Awaitable[dict]]]
 
 
+def _expire_future(future: asyncio.Future) -> None:
+    """Fail a pending request future with a timeout if no response has arrived"""
+    if not future.done():
+        future.set_exception(asyncio.TimeoutError())
+
+
 class JsonRpcClient:
     """
     Minimal async JSON-RPC 2.0 client for stdio transport
@@ -103,9 +112,13 @@ class JsonRpcClient:
 
         await self._send_message(message)
 
+        # Expire the future with a single loop timer rather than asyncio.wait_for,
+        # which wraps it in an extra waiter future on every request
+        timeout_handle = self._loop.call_later(timeout, _expire_future, future)
         try:
-            return await asyncio.wait_for(future, timeout=timeout)
+            return await future
         finally:
+            timeout_handle.cancel()
             with self._pending_lock:
                 self.pending_requests.pop(request_id, None)
 
@@ -159,7 +172,7 @@ class JsonRpcClient:
                     self._handle_message(message)
         except Exception as e:
             if self._running:
-                print(f"JSON-RPC read loop error: {e}")
+                logger.error("JSON-RPC read loop error: %s", e)
 
     def _read_exact(self, num_bytes: int) -> bytes:
         """
@@ -7,6 +7,7 @@ conversation sessions with the Copilot CLI.
 
 import asyncio
 import inspect
+import logging
 import threading
 from typing import Any, Callable, Optional
 
@@ -25,6 +26,8 @@ from .types import (
     SessionEvent as SessionEventTypeAlias,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class CopilotSession:
     """
@@ -239,7 +242,7 @@ class CopilotSession:
             try:
                 handler(event)
             except Exception as e:
-                print(f"Error in session event handler: {e}")
+                logger.error("Error in session event handler: %s", e)
 
     def _register_tools(self, tools: Optional[list[Tool]]) -> None:
         """
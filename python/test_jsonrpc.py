@@ -5,6 +5,7 @@ Tests for the JSON-RPC client implementation, focusing on proper handling
 of large payloads and short reads from pipes.
 """
 
+import asyncio
 import io
 import json
 
@@ -265,3 +266,32 @@ class TestReadMessageWithLargePayloads:
 
         result2 = client._read_message()
         assert result2 == message2
+
+
+class TestRequestTimeout:
+    """Tests for request() timeout handling"""
+
+    @pytest.mark.asyncio
+    async def test_request_returns_result_before_timeout(self):
+        """Test that a response arriving in time resolves the request"""
+        client = JsonRpcClient(MockProcess())
+        client._loop = asyncio.get_running_loop()
+
+        task = asyncio.create_task(client.request("ping", timeout=5.0))
+        await asyncio.sleep(0)
+        (request_id,) = client.pending_requests
+        client._handle_message({"jsonrpc": "2.0", "id": request_id, "result": {"ok": True}})
+
+        assert await task == {"ok": True}
+        assert client.pending_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_request_times_out_without_response(self):
+        """Test that a request with no response raises TimeoutError and is cleaned up"""
+        client = JsonRpcClient(MockProcess())
+        client._loop = asyncio.get_running_loop()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.request("ping", timeout=0.01)
+
+        assert client.pending_requests == {}